@@ -12,3 +12,4 @@ SLACK_BOT_TOKEN = os.environ["SLACK_BOT_TOKEN"]
 SLACK_CHANNEL_ID = os.environ["SLACK_CHANNEL_ID"]
 REPORT_INTERVAL = ReportInterval(os.environ["REPORT_INTERVAL"])
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+CACHE_DIR = os.getenv("CACHE_DIR")
@@ -1,5 +1,7 @@
 from typing import Final
 
+DISK_CACHE_SIZE_LIMIT: Final[int] = 2**30
+
 PIE_CHART_COLORS: Final[list[str]] = [
     "gray",
     "purple",
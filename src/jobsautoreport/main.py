@@ -3,12 +3,15 @@ import sys
 from datetime import datetime, timezone
 
 from dateutil.relativedelta import relativedelta
+from diskcache import Cache  # type: ignore
 from opensearchpy import OpenSearch
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 from jobsautoreport import config
+from jobsautoreport.consts import DISK_CACHE_SIZE_LIMIT
 from jobsautoreport.models import ReportInterval
-from jobsautoreport.query import Querier
+from jobsautoreport.query import OrjsonSerializer, Querier
 from jobsautoreport.report import Reporter
 from jobsautoreport.slack import SlackReporter
 from jobsautoreport.trends import TrendDetector
@@ -34,7 +37,9 @@ def main() -> None:
     os_pwd = config.ES_PASSWORD
     os_host = config.ES_URL
 
-    client = OpenSearch(os_host, http_auth=(os_usr, os_pwd))
+    client = OpenSearch(
+        os_host, http_auth=(os_usr, os_pwd), serializer=OrjsonSerializer()
+    )
 
     now = datetime.now(tz=timezone.utc)
     if config.REPORT_INTERVAL == ReportInterval.WEEK:
@@ -71,11 +76,20 @@ def main() -> None:
     steps_index = config.ES_STEP_INDEX + "-*"
     usages_index = config.ES_USAGE_INDEX + "-*"
 
+    disk_cache = None
+    if config.CACHE_DIR is not None:
+        disk_cache = Cache(
+            directory=config.CACHE_DIR,
+            size_limit=DISK_CACHE_SIZE_LIMIT,
+            eviction_policy="least-recently-used",
+        )
+
     querier = Querier(
         opensearch_client=client,
         jobs_index=jobs_index,
         steps_index=steps_index,
         usages_index=usages_index,
+        disk_cache=disk_cache,
     )
     reporter = Reporter(querier=querier)
 
@@ -92,6 +106,8 @@ def main() -> None:
     trends = trend_detecter.detect_trends()
 
     web_client = WebClient(token=config.SLACK_BOT_TOKEN)
+    # wait for the duration Slack asks for in Retry-After when rate limited
+    web_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=5))
     slack_reporter = SlackReporter(
         web_client=web_client, channel_id=config.SLACK_CHANNEL_ID
     )
@@ -1,35 +1,60 @@
 import logging
 
 import plotly.graph_objects as graph_objects  # type: ignore
+import plotly.io  # type: ignore
 from plotly import express
 
 from jobsautoreport.report import IdentifiedJobMetrics, JobIdentifier
 
 logger = logging.getLogger(__name__)
 
+# The graphs contain no LaTeX, so plotly's shared kaleido renderer doesn't need to
+# load MathJax when it starts
+plotly.io.kaleido.scope.mathjax = None
+
 
 class Plotter:
+    def __init__(self) -> None:
+        # layout shared by the bar graphs, validated once instead of for every graph.
+        # Figures copy the layout they are given, so it is never mutated
+        self._bar_graph_layout = graph_objects.Layout(
+            font_family="Arial",
+            font_size=12,
+            yaxis=dict(
+                tickfont=dict(size=10),
+                showgrid=True,
+                gridwidth=1,
+                gridcolor="lightgray",
+            ),
+        )
+
     def create_most_failing_jobs_graph(
         self,
         jobs: list[IdentifiedJobMetrics],
         file_title: str,
-    ) -> tuple[str, str]:
+    ) -> tuple[str, bytes]:
         is_variant_unique = JobIdentifier.is_variant_unique(
             [identified_job_metrics.job_identifier for identified_job_metrics in jobs]
         )
-        names = [
-            identified_job_metrics.job_identifier.get_slack_name(is_variant_unique)
-            for identified_job_metrics in jobs
-        ]
-        successes = [
-            identified_job_metrics.metrics.successes for identified_job_metrics in jobs
-        ]
-        failures = [
-            identified_job_metrics.metrics.failures for identified_job_metrics in jobs
-        ]
-
-        filename, file_path = self._file_name_proccesor(file_title=file_title)
-        fig = graph_objects.Figure()
+        names, successes, failures = (
+            zip(
+                *(
+                    (
+                        identified_job_metrics.job_identifier.get_slack_name(
+                            is_variant_unique
+                        ),
+                        identified_job_metrics.metrics.successes,
+                        identified_job_metrics.metrics.failures,
+                    )
+                    for identified_job_metrics in jobs
+                )
+            )
+            if jobs
+            else ((), (), ())
+        )
+
+        filename = self._file_name_proccesor(file_title=file_title)
+        fig = graph_objects.Figure(layout=self._bar_graph_layout)
         fig.add_trace(
             graph_objects.Bar(
                 x=successes,
@@ -63,39 +88,39 @@ class Plotter:
         fig.update_layout(
             barmode="stack",
             title_text=file_title,
-            font_family="Arial",
-            font_size=12,
             xaxis_title="Trigger Count",
             yaxis_title="Job",
-            yaxis=dict(
-                tickfont=dict(size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="lightgray",
-            ),
         )
 
-        fig.write_image(file_path, scale=3)
-        logger.info("image created at %s successfully", file_path)
+        image = self._render_image(fig=fig)
+        logger.info("image %s created successfully", filename)
 
-        return filename, file_path
+        return filename, image
 
     def create_most_triggered_jobs_graph(
         self, jobs: list[IdentifiedJobMetrics], file_title: str
-    ) -> tuple[str, str]:
+    ) -> tuple[str, bytes]:
         is_variant_unique = JobIdentifier.is_variant_unique(
             [identified_job_metrics.job_identifier for identified_job_metrics in jobs]
         )
-        names = [
-            identified_job_metrics.job_identifier.get_slack_name(is_variant_unique)
-            for identified_job_metrics in jobs
-        ]
-        quantities = [
-            identified_job_metrics.metrics.total for identified_job_metrics in jobs
-        ]
+        names, quantities = (
+            zip(
+                *(
+                    (
+                        identified_job_metrics.job_identifier.get_slack_name(
+                            is_variant_unique
+                        ),
+                        identified_job_metrics.metrics.total,
+                    )
+                    for identified_job_metrics in jobs
+                )
+            )
+            if jobs
+            else ((), ())
+        )
 
-        filename, file_path = self._file_name_proccesor(file_title=file_title)
-        fig = graph_objects.Figure()
+        filename = self._file_name_proccesor(file_title=file_title)
+        fig = graph_objects.Figure(layout=self._bar_graph_layout)
         fig.add_trace(
             graph_objects.Bar(
                 x=quantities,
@@ -114,38 +139,40 @@ class Plotter:
 
         fig.update_layout(
             title_text=file_title,
-            font_family="Arial",
-            font_size=12,
             xaxis_title="Trigger Count",
             yaxis_title="Job",
-            yaxis=dict(
-                tickfont=dict(size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="lightgray",
-            ),
         )
 
-        fig.write_image(file_path, scale=3)
-        logger.info("image created at %s successfully", file_path)
+        image = self._render_image(fig=fig)
+        logger.info("image %s created successfully", filename)
 
-        return filename, file_path
+        return filename, image
 
     def create_most_expensive_jobs_graph(
         self,
         jobs: list[IdentifiedJobMetrics],
         file_title: str,
-    ) -> tuple[str, str]:
+    ) -> tuple[str, bytes]:
         is_variant_unique = JobIdentifier.is_variant_unique(
             [identified_job_metrics.job_identifier for identified_job_metrics in jobs]
         )
-        names = [
-            identified_job_metrics.job_identifier.get_slack_name(is_variant_unique)
-            for identified_job_metrics in jobs
-        ]
-        costs = [identified_job_metrics.metrics.cost for identified_job_metrics in jobs]
-        filename, file_path = self._file_name_proccesor(file_title=file_title)
-        fig = graph_objects.Figure()
+        names, costs = (
+            zip(
+                *(
+                    (
+                        identified_job_metrics.job_identifier.get_slack_name(
+                            is_variant_unique
+                        ),
+                        identified_job_metrics.metrics.cost,
+                    )
+                    for identified_job_metrics in jobs
+                )
+            )
+            if jobs
+            else ((), ())
+        )
+        filename = self._file_name_proccesor(file_title=file_title)
+        fig = graph_objects.Figure(layout=self._bar_graph_layout)
 
         fig.add_trace(
             graph_objects.Bar(
@@ -165,22 +192,14 @@ class Plotter:
 
         fig.update_layout(
             title_text=file_title,
-            font_family="Arial",
-            font_size=12,
             xaxis_title="Cost (USD)",
             yaxis_title="Job",
-            yaxis=dict(
-                tickfont=dict(size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="lightgray",
-            ),
         )
 
-        fig.write_image(file_path, scale=3)
-        logger.info("image created at %s successfully", file_path)
+        image = self._render_image(fig=fig)
+        logger.info("image %s created successfully", filename)
 
-        return filename, file_path
+        return filename, image
 
     def create_pie_chart(
         self,
@@ -188,8 +207,8 @@ class Plotter:
         values: list[int],
         colors: list[str],
         title: str,
-    ) -> tuple[str, str]:
-        filename, file_path = self._file_name_proccesor(file_title=title)
+    ) -> tuple[str, bytes]:
+        filename = self._file_name_proccesor(file_title=title)
         fig = graph_objects.Figure(
             data=[
                 graph_objects.Pie(
@@ -208,13 +227,15 @@ class Plotter:
             font=dict(size=20),
         )
 
-        fig.write_image(file_path, scale=3)
-        logger.info("image created at %s successfully", file_path)
+        image = self._render_image(fig=fig)
+        logger.info("image %s created successfully", filename)
+
+        return filename, image
 
-        return filename, file_path
+    def _render_image(self, fig: graph_objects.Figure) -> bytes:
+        # rendered at the size Slack previews images, rasterizing cost grows with pixels
+        return fig.to_image(format="png", width=900, height=600, scale=1)
 
     @staticmethod
-    def _file_name_proccesor(file_title: str) -> tuple[str, str]:
-        filename = file_title.replace(" ", "_").lower()
-        file_path = f"/tmp/{filename}.png"
-        return filename, file_path
+    def _file_name_proccesor(file_title: str) -> str:
+        return file_title.replace(" ", "_").lower()
@@ -1,14 +1,49 @@
+import itertools
 import logging
-from datetime import datetime
-from typing import Any
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, Optional, Sequence, Type, TypeVar, Union
 
+import orjson
+from cachetools import TTLCache
+from diskcache import Cache  # type: ignore
 from opensearchpy import OpenSearch, helpers
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
+from pydantic import BaseModel
 
 from prowjobsscraper.equinix_usages import EquinixUsageEvent
 from prowjobsscraper.event import JobDetails, StepEvent
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound=BaseModel)
+
+# a page of hits, the error that ended a slice, or None once a slice is exhausted
+_SlicePage = Union[list[dict[Any, Any]], Exception, None]
+
+
+class OrjsonSerializer(JSONSerializer):
+    """OrjsonSerializer decodes and encodes OpenSearch payloads with orjson"""
+
+    def loads(self, s: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data: Any) -> Any:
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            return orjson.dumps(data, default=self.default).decode()
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
 
 class Querier:
     """Querier queries data from elasticsearch database and parses it"""
@@ -19,11 +54,35 @@ class Querier:
         jobs_index: str,
         steps_index: str,
         usages_index: str,
+        scan_size: int = 2000,
+        scan_request_timeout: float = 60,
+        scan_keep_alive: str = "5m",
+        scan_slices: Optional[int] = None,
+        cache_size: int = 32,
+        cache_ttl: float = 300,
+        disk_cache: Optional[Cache] = None,
+        disk_cache_settle_time: timedelta = timedelta(days=1),
     ):
         self._os_client = opensearch_client
         self._jobs_index = jobs_index
         self._steps_index = steps_index
         self._usages_index = usages_index
+        self._scan_size = scan_size
+        self._scan_request_timeout = scan_request_timeout
+        self._scan_keep_alive = scan_keep_alive
+        self._scan_slices = scan_slices
+        self._shards_count: dict[str, int] = {}
+        # Only helps a Querier that is asked for the same window more than once, the
+        # report asks for two different windows per process. Results are stored as
+        # tuples so callers can't mutate the cached entries
+        self._cache: TTLCache[tuple[str, str, str, str], tuple[Any, ...]] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl
+        )
+        # Parsed results persisted across runs, per day of the queried windows.
+        # Documents keep arriving for a while after a day ends (e.g. Equinix usages),
+        # so only the days that ended disk_cache_settle_time ago are persisted
+        self._disk_cache = disk_cache
+        self._disk_cache_settle_time = disk_cache_settle_time
 
     @staticmethod
     def _get_query_all_jobs(from_date: datetime, to_date: datetime) -> dict:
@@ -99,69 +158,393 @@ class Querier:
         }
 
     def query_jobs(self, from_date: datetime, to_date: datetime) -> list[JobDetails]:
-        query = self._get_query_all_jobs(from_date=from_date, to_date=to_date)
-        return self._query_jobs_and_log(query=query)
+        return self._query_cached(
+            query_name="jobs",
+            index_name=self._jobs_index,
+            from_date=from_date,
+            to_date=to_date,
+            model=JobDetails,
+            query_function=lambda from_date, to_date: self._query_jobs_and_log(
+                query=self._get_query_all_jobs(from_date=from_date, to_date=to_date)
+            ),
+        )
 
     def query_packet_setup_step_events(
         self, from_date: datetime, to_date: datetime
     ) -> list[StepEvent]:
-        query = self._get_query_steps_by_name(
-            from_date=from_date, to_date=to_date, name="baremetalds-packet-setup"
+        step_name = "baremetalds-packet-setup"
+        return self._query_cached(
+            query_name=f"steps:{step_name}",
+            index_name=self._steps_index,
+            from_date=from_date,
+            to_date=to_date,
+            model=StepEvent,
+            query_function=lambda from_date, to_date: self._query_step_events_and_log(
+                query=self._get_query_steps_by_name(
+                    from_date=from_date, to_date=to_date, name=step_name
+                )
+            ),
         )
-        return self._query_step_events_and_log(query=query)
 
     def query_usage_events(
         self, from_date: datetime, to_date: datetime
     ) -> list[EquinixUsageEvent]:
-        query = self._get_query_usages(from_date=from_date, to_date=to_date)
-        return self._query_usage_events_and_log(query=query)
+        return self._query_cached(
+            query_name="usages",
+            index_name=self._usages_index,
+            from_date=from_date,
+            to_date=to_date,
+            model=EquinixUsageEvent,
+            query_function=lambda from_date, to_date: self._query_usage_events_and_log(
+                query=self._get_query_usages(from_date=from_date, to_date=to_date)
+            ),
+        )
 
-    def _query_jobs_and_log(self, query: dict[str, Any]) -> list[JobDetails]:
-        logger.debug("OpenSearch query: %s", query)
-        elastic_search_jobs = self._scan(query=query, index_name=self._jobs_index)
-        return self._parse_jobs(elastic_search_jobs=elastic_search_jobs)
+    def clear_cache(self) -> None:
+        # the disk cache may be shared with other processes, its owner clears it
+        self._cache.clear()
 
-    def _query_step_events_and_log(self, query: dict[str, Any]) -> list[StepEvent]:
-        logger.debug("OpenSearch query: %s", query)
-        elastic_search_steps = self._scan(query=query, index_name=self._steps_index)
-        return self._parse_step_events(elastic_search_steps=elastic_search_steps)
+    def _query_cached(
+        self,
+        query_name: str,
+        index_name: str,
+        from_date: datetime,
+        to_date: datetime,
+        model: Type[T],
+        query_function: Callable[[datetime, datetime], Sequence[T]],
+    ) -> list[T]:
+        # the same index can be queried for different documents, e.g. for other steps
+        key = (query_name, index_name, from_date.isoformat(), to_date.isoformat())
+        results = self._cache.get(key)
+        if results is not None:
+            logger.debug("Query results for %s served from cache", key)
+            return list(results)
 
-    def _query_usage_events_and_log(
-        self, query: dict[str, Any]
-    ) -> list[EquinixUsageEvent]:
-        logger.debug("OpenSearch query: %s", query)
-        elastic_search_usages = self._scan(query=query, index_name=self._usages_index)
-        return self._parse_usage_events(elastic_search_usages=elastic_search_usages)
-
-    def _scan(self, query: dict[str, Any], index_name: str) -> list[dict[Any, Any]]:
-        res = helpers.scan(
-            client=self._os_client,
-            query=query,
-            index=index_name,
+        results = self._query_through_disk_cache(
+            query_name=query_name,
+            index_name=index_name,
+            from_date=from_date,
+            to_date=to_date,
+            model=model,
+            query_function=query_function,
         )
-        return list(res)
+        self._cache[key] = results
+        return list(results)
 
-    def _parse_jobs(
-        self, elastic_search_jobs: list[dict[Any, Any]]
-    ) -> list[JobDetails]:
-        return [self._parse_job(job["_source"]["job"]) for job in elastic_search_jobs]
+    def _query_through_disk_cache(
+        self,
+        query_name: str,
+        index_name: str,
+        from_date: datetime,
+        to_date: datetime,
+        model: Type[T],
+        query_function: Callable[[datetime, datetime], Sequence[T]],
+    ) -> tuple[T, ...]:
+        disk_cache = self._disk_cache
+        if disk_cache is None:
+            return tuple(query_function(from_date, to_date))
 
-    def _parse_step_events(
-        self, elastic_search_steps: list[dict[Any, Any]]
-    ) -> list[StepEvent]:
+        # A document overlapping several parts of the window, e.g. a usage spanning
+        # midnight, is returned by each of them. The models are frozen and hashable,
+        # so the duplicates are dropped while keeping the parts' order
+        results: dict[T, None] = {}
+        for part_from_date, part_to_date, is_settled_day in self._split_window(
+            from_date=from_date, to_date=to_date
+        ):
+            if is_settled_day:
+                part_results = self._query_settled_day(
+                    disk_cache=disk_cache,
+                    query_name=query_name,
+                    index_name=index_name,
+                    day=part_from_date,
+                    model=model,
+                    query_function=query_function,
+                )
+            else:
+                part_results = query_function(part_from_date, part_to_date)
+            results.update(dict.fromkeys(part_results))
+
+        return tuple(results)
+
+    def _split_window(
+        self, from_date: datetime, to_date: datetime
+    ) -> Iterator[tuple[datetime, datetime, bool]]:
+        """Splits the window into the whole days that have settled, which consecutive
+        report windows share, and the parts around them that are queried every time.
+        Each part is yielded with whether it is a settled day.
+        """
+        settled_until = min(
+            to_date, datetime.now(tz=to_date.tzinfo) - self._disk_cache_settle_time
+        )
+        day = from_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if day < from_date:
+            day += timedelta(days=1)
+
+        part_from_date = from_date
+        while day + timedelta(days=1) <= settled_until:
+            if part_from_date < day:
+                yield part_from_date, day, False
+            yield day, day + timedelta(days=1), True
+            day += timedelta(days=1)
+            part_from_date = day
+
+        # the queries' ranges include their end, so a window ending on a settled day's
+        # end is already covered
+        if part_from_date < to_date or part_from_date == from_date:
+            yield part_from_date, to_date, False
+
+    @staticmethod
+    def _query_settled_day(
+        disk_cache: Cache,
+        query_name: str,
+        index_name: str,
+        day: datetime,
+        model: Type[T],
+        query_function: Callable[[datetime, datetime], Sequence[T]],
+    ) -> Sequence[T]:
+        key = (query_name, index_name, day.isoformat())
+        serialized_results = disk_cache.get(key)
+        if serialized_results is not None:
+            logger.debug("Query results for %s loaded from disk cache", key)
+            return [
+                model.parse_obj(result) for result in orjson.loads(serialized_results)
+            ]
+
+        results = query_function(day, day + timedelta(days=1))
+        disk_cache.set(key, orjson.dumps([result.dict() for result in results]))
+        return results
+
+    def _query_jobs_and_log(self, query: dict[str, Any]) -> list[JobDetails]:
+        self._log_query(query=query)
+        return [
+            self._parse_job(job["_source"]["job"])
+            for job in self._scan(
+                query=query,
+                index_name=self._jobs_index,
+                sort=[{"job.start_time": "asc"}, {"job.build_id": "asc"}],
+                source_includes=["job"],
+            )
+        ]
+
+    def _query_step_events_and_log(self, query: dict[str, Any]) -> list[StepEvent]:
+        self._log_query(query=query)
         return [
             self._parse_step_event(step_event["_source"])
-            for step_event in elastic_search_steps
+            for step_event in self._scan(
+                query=query,
+                index_name=self._steps_index,
+                sort=[
+                    {"job.start_time": "asc"},
+                    {"job.build_id": "asc"},
+                    {"step.name.keyword": "asc"},
+                ],
+                source_includes=["job", "step"],
+            )
         ]
 
-    def _parse_usage_events(
-        self, elastic_search_usages: list[dict[Any, Any]]
+    def _query_usage_events_and_log(
+        self, query: dict[str, Any]
     ) -> list[EquinixUsageEvent]:
+        self._log_query(query=query)
         return [
             self._parse_usage_event(usage_event["_source"])
-            for usage_event in elastic_search_usages
+            for usage_event in self._scan(
+                query=query,
+                index_name=self._usages_index,
+                sort=[
+                    {"usage.start_date": "asc"},
+                    {"job.build_id": "asc"},
+                    {"usage.plan": "asc"},
+                ],
+                source_includes=["job.build_id", "usage"],
+            )
         ]
 
+    @staticmethod
+    def _log_query(query: dict[str, Any]) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OpenSearch query: %s", orjson.dumps(query).decode())
+
+    def _scan(
+        self,
+        query: dict[str, Any],
+        index_name: str,
+        sort: list[dict[str, str]],
+        source_includes: list[str],
+    ) -> Iterator[dict[Any, Any]]:
+        slices = self._get_scan_slices(index_name=index_name)
+        # A point in time paginated with search_after doesn't keep a scroll context
+        # open on the shards between pages, and one is shared by all the slices.
+        # (opensearch-py's stubs lag behind its point in time API)
+        pit_id = self._os_client.create_point_in_time(  # type: ignore[attr-defined]
+            index=index_name,
+            keep_alive=self._scan_keep_alive,
+            request_timeout=self._scan_request_timeout,
+        )["pit_id"]
+        try:
+            if slices <= 1:
+                # hits are consumed lazily by the parsers instead of being materialized
+                yield from itertools.chain.from_iterable(
+                    self._scan_slice(
+                        query=query,
+                        pit_id=pit_id,
+                        index_name=index_name,
+                        sort=sort,
+                        source_includes=source_includes,
+                    )
+                )
+            else:
+                yield from self._scan_sliced(
+                    query=query,
+                    pit_id=pit_id,
+                    slices=slices,
+                    index_name=index_name,
+                    sort=sort,
+                    source_includes=source_includes,
+                )
+        finally:
+            self._os_client.delete_point_in_time(  # type: ignore[attr-defined]
+                body={"pit_id": [pit_id]}
+            )
+
+    def _scan_sliced(
+        self,
+        query: dict[str, Any],
+        pit_id: str,
+        slices: int,
+        index_name: str,
+        sort: list[dict[str, str]],
+        source_includes: list[str],
+    ) -> Iterator[dict[Any, Any]]:
+        # Each slice is paginated by its own thread, served by its own shards. Pages
+        # are handed to the parsers as they arrive, and the bounded queue holds back
+        # the slices that get ahead of them
+        pages: queue.Queue[_SlicePage] = queue.Queue(maxsize=slices)
+        stopped = threading.Event()
+        with ThreadPoolExecutor(max_workers=slices) as executor:
+            for slice_id in range(slices):
+                executor.submit(
+                    self._produce_slice,
+                    pages=pages,
+                    stopped=stopped,
+                    query={**query, "slice": {"id": slice_id, "max": slices}},
+                    pit_id=pit_id,
+                    index_name=index_name,
+                    sort=sort,
+                    source_includes=source_includes,
+                )
+
+            try:
+                running_slices = slices
+                while running_slices > 0:
+                    page = pages.get()
+                    if page is None:
+                        running_slices -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        yield from page
+            finally:
+                # lets the other slices return when one failed or the scan was dropped
+                stopped.set()
+
+    def _produce_slice(
+        self,
+        pages: queue.Queue[_SlicePage],
+        stopped: threading.Event,
+        query: dict[str, Any],
+        pit_id: str,
+        index_name: str,
+        sort: list[dict[str, str]],
+        source_includes: list[str],
+    ) -> None:
+        try:
+            for page in self._scan_slice(
+                query=query,
+                pit_id=pit_id,
+                index_name=index_name,
+                sort=sort,
+                source_includes=source_includes,
+            ):
+                if not self._put_page(pages=pages, stopped=stopped, page=page):
+                    return
+            self._put_page(pages=pages, stopped=stopped, page=None)
+        except Exception as e:
+            self._put_page(pages=pages, stopped=stopped, page=e)
+
+    @staticmethod
+    def _put_page(
+        pages: queue.Queue[_SlicePage], stopped: threading.Event, page: _SlicePage
+    ) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _scan_slice(
+        self,
+        query: dict[str, Any],
+        pit_id: str,
+        index_name: str,
+        sort: list[dict[str, str]],
+        source_includes: list[str],
+    ) -> Iterator[list[dict[Any, Any]]]:
+        # search_after needs a sort that is unique per document so none are skipped
+        search_after = None
+        while True:
+            body = {
+                **query,
+                "pit": {"id": pit_id, "keep_alive": self._scan_keep_alive},
+                "sort": sort,
+                "size": self._scan_size,
+            }
+            if search_after is not None:
+                body["search_after"] = search_after
+
+            response = self._os_client.search(
+                body=body,
+                _source_includes=source_includes,
+                request_timeout=self._scan_request_timeout,
+            )
+            shards = response["_shards"]
+            if shards["successful"] + shards.get("skipped", 0) < shards["total"]:
+                raise helpers.ScanError(
+                    pit_id,
+                    f"Search failed on {shards['total'] - shards['successful']} "
+                    f"of {shards['total']} shards of {index_name}",
+                )
+
+            hits = response["hits"]["hits"]
+            yield hits
+            if len(hits) < self._scan_size:
+                return
+
+            search_after = hits[-1]["sort"]
+
+    def _get_scan_slices(self, index_name: str) -> int:
+        if self._scan_slices is not None:
+            return self._scan_slices
+
+        if index_name not in self._shards_count:
+            settings = self._os_client.indices.get_settings(
+                index=index_name, name="index.number_of_shards"
+            )
+            self._shards_count[index_name] = max(
+                (
+                    int(index_settings["settings"]["index"]["number_of_shards"])
+                    for index_settings in settings.values()
+                ),
+                default=1,
+            )
+            logger.debug(
+                "Scanning %s with %d slices", index_name, self._shards_count[index_name]
+            )
+
+        return self._shards_count[index_name]
+
     @staticmethod
     def _parse_job(elastic_search_job: dict[Any, Any]) -> JobDetails:
         return JobDetails.parse_obj(elastic_search_job)
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Final, Optional, Union
 
 from plotly import express  # type: ignore
@@ -14,6 +15,52 @@ from jobsautoreport.trends import Trends
 
 logger = logging.getLogger(__name__)
 
+# Static blocks shared by every report, only the text sections are built per report
+_DIVIDER_BLOCK: Final[dict[str, Any]] = {"type": "divider"}
+_HEADER_BLOCK: Final[dict[str, Any]] = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "CI Report",
+        "emoji": True,
+    },
+}
+_PERIODIC_TITLE_BLOCK: Final[dict[str, Any]] = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Periodic e2e/subsystem jobs*\n",
+    },
+}
+_POSTSUBMIT_TITLE_BLOCK: Final[dict[str, Any]] = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Postsubmit jobs*\n",
+    },
+}
+_PRESUBMIT_TITLE_BLOCK: Final[dict[str, Any]] = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Presubmit e2e/subsystem jobs*\n",
+    },
+}
+_EQUINIX_TITLE_BLOCK: Final[dict[str, Any]] = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Equinix*",
+    },
+}
+
+# a graph's title and the rendering of its file name and image
+_TitledGraph = tuple[str, Future[tuple[str, bytes]]]
+# a section's message and the graphs uploaded after it
+_ReportSection = tuple[
+    Callable[[Report, Trends], list[dict[str, Any]]], list[_TitledGraph]
+]
+
 
 class SlackReporter:
     """SlackReporter sends the report the Reporter generated to a given slack channel"""
@@ -21,6 +68,7 @@ class SlackReporter:
     def __init__(self, web_client: WebClient, channel_id: str) -> None:
         self._client = web_client
         self._channel_id = channel_id
+        self._plotter = Plotter()
         self._trend_arrows: Final[dict[str, str]] = {
             "up": "arrow_upper_right",
             "down": "arrow_lower_right",
@@ -64,157 +112,161 @@ class SlackReporter:
     def _upload_file(
         self,
         file_title: str,
-        file_path: str,
+        file: bytes,
         filename: str,
         thread_time_stamp: Optional[str],
     ) -> None:
-        response = self._client.files_upload(
-            channels=[self._channel_id],
-            file=file_path,
+        response = self._client.files_upload_v2(
+            channel=self._channel_id,
+            file=file,
             filename=filename,
             initial_comment=file_title,
             thread_ts=thread_time_stamp,
+            # the uploaded file's metadata isn't used, skip the extra files.info calls
+            request_file_info=False,
         )
         response.validate()
         logger.info(f"{filename} was uploaded successfully")
 
-    def send_report(self, report: Report, trends: Trends) -> None:
-        plotter = Plotter()
-        thread_time_stamp = self._post_message_without_trends(
-            report=report,
-            format_function=self._format_header_message,
-            thread_time_stamp=None,
-        )
+    def _submit_sections(
+        self, executor: ThreadPoolExecutor, report: Report
+    ) -> list[_ReportSection]:
+        """Decides which sections the report has, in posting order, and submits the
+        rendering of each section's graphs along with their titles.
+        """
+        sections: list[_ReportSection] = []
 
         if report.success_rate_for_e2e_or_subsystem_periodic_jobs is not None:
-            self._post_message_with_trends(
-                report=report,
-                trends=trends,
-                format_function=self._format_periodic_comment,
-                thread_time_stamp=thread_time_stamp,
-            )
+            graphs: list[_TitledGraph] = []
             # There should not be an empty graph when there are no failures
             if report.number_of_failing_e2e_or_subsystem_periodic_jobs > 0:
-                filename, file_path = plotter.create_most_failing_jobs_graph(
-                    jobs=report.top_10_failing_e2e_or_subsystem_periodic_jobs,
-                    file_title="Top 10 Failed Periodic Jobs",
-                )
-                self._upload_file(
-                    file_title="Top 10 Failed Periodic Jobs",
-                    filename=filename,
-                    file_path=file_path,
-                    thread_time_stamp=thread_time_stamp,
+                graphs.append(
+                    (
+                        "Top 10 Failed Periodic Jobs",
+                        executor.submit(
+                            self._plotter.create_most_failing_jobs_graph,
+                            jobs=report.top_10_failing_e2e_or_subsystem_periodic_jobs,
+                            file_title="Top 10 Failed Periodic Jobs",
+                        ),
+                    )
                 )
+            sections.append((self._format_periodic_comment, graphs))
 
         if report.success_rate_for_e2e_or_subsystem_presubmit_jobs is not None:
-            self._post_message_with_trends(
-                report=report,
-                trends=trends,
-                format_function=self._format_presubmit_comment,
-                thread_time_stamp=thread_time_stamp,
-            )
+            graphs = []
             if report.number_of_failing_e2e_or_subsystem_presubmit_jobs > 0:
-                filename, file_path = plotter.create_most_failing_jobs_graph(
-                    jobs=report.top_10_failing_e2e_or_subsystem_presubmit_jobs,
-                    file_title="Top 10 Failed Presubmit Jobs",
+                graphs.append(
+                    (
+                        "Top 10 Failed Presubmit Jobs",
+                        executor.submit(
+                            self._plotter.create_most_failing_jobs_graph,
+                            jobs=report.top_10_failing_e2e_or_subsystem_presubmit_jobs,
+                            file_title="Top 10 Failed Presubmit Jobs",
+                        ),
+                    )
                 )
-                self._upload_file(
-                    file_title="Top 10 Failed Presubmit Jobs",
-                    filename=filename,
-                    file_path=file_path,
-                    thread_time_stamp=thread_time_stamp,
+            graphs.append(
+                (
+                    "Top 5 Triggered Presubmit Jobs",
+                    executor.submit(
+                        self._plotter.create_most_triggered_jobs_graph,
+                        jobs=report.top_5_most_triggered_e2e_or_subsystem_jobs,
+                        file_title="Top 5 Triggered Presubmit Jobs",
+                    ),
                 )
-            filename, file_path = plotter.create_most_triggered_jobs_graph(
-                jobs=report.top_5_most_triggered_e2e_or_subsystem_jobs,
-                file_title="Top 5 Triggered Presubmit Jobs",
-            )
-            self._upload_file(
-                file_title="Top 5 Triggered Presubmit Jobs",
-                filename=filename,
-                file_path=file_path,
-                thread_time_stamp=thread_time_stamp,
             )
+            sections.append((self._format_presubmit_comment, graphs))
 
         if report.success_rate_for_postsubmit_jobs is not None:
-            self._post_message_with_trends(
-                report=report,
-                trends=trends,
-                format_function=self._format_postsubmit_comment,
-                thread_time_stamp=thread_time_stamp,
-            )
+            graphs = []
             if report.number_of_failing_postsubmit_jobs > 0:
-                filename, file_path = plotter.create_most_failing_jobs_graph(
-                    jobs=report.top_10_failing_postsubmit_jobs,
-                    file_title="Top 10 Failed Postsubmit Jobs",
-                )
-                self._upload_file(
-                    file_title="Top 10 Failed Postsubmit Jobs",
-                    filename=filename,
-                    file_path=file_path,
-                    thread_time_stamp=thread_time_stamp,
+                graphs.append(
+                    (
+                        "Top 10 Failed Postsubmit Jobs",
+                        executor.submit(
+                            self._plotter.create_most_failing_jobs_graph,
+                            jobs=report.top_10_failing_postsubmit_jobs,
+                            file_title="Top 10 Failed Postsubmit Jobs",
+                        ),
+                    )
                 )
+            sections.append((self._format_postsubmit_comment, graphs))
 
         if report.total_equinix_machines_cost > 0:
-            self._post_message_with_trends(
-                report=report,
-                trends=trends,
-                format_function=self._format_equinix_message,
-                thread_time_stamp=thread_time_stamp,
-            )
-            filename, file_path = plotter.create_most_expensive_jobs_graph(
-                jobs=report.top_5_most_expensive_jobs,
-                file_title="Top 5 Most Expensive Jobs",
-            )
-            self._upload_file(
-                file_title="Top 5 Most Expensive Jobs",
-                filename=filename,
-                file_path=file_path,
-                thread_time_stamp=thread_time_stamp,
-            )
-            labels, values = self._format_cost_by_machine_type_metrics(
-                report.cost_by_machine_type
-            )
-            filename, file_path = plotter.create_pie_chart(
-                labels=labels,
-                values=values,
-                colors=express.colors.sequential.Rainbow_r,
-                title="Cost by Machine Type",
-            )
-            self._upload_file(
-                file_title="Cost by Machine Type",
-                filename=filename,
-                file_path=file_path,
-                thread_time_stamp=thread_time_stamp,
-            )
-            labels, values = self._format_cost_by_job_type_metrics(
+            (
+                machine_type_labels,
+                machine_type_values,
+            ) = self._format_cost_by_machine_type_metrics(report.cost_by_machine_type)
+            job_type_labels, job_type_values = self._format_cost_by_job_type_metrics(
                 report.cost_by_job_type
             )
-            filename, file_path = plotter.create_pie_chart(
-                labels=labels,
-                values=values,
-                colors=PIE_CHART_COLORS,
-                title="Cost by Job Type",
-            )
-            self._upload_file(
-                file_title="Cost by Job Type",
-                filename=filename,
-                file_path=file_path,
-                thread_time_stamp=thread_time_stamp,
+            graphs = [
+                (
+                    "Top 5 Most Expensive Jobs",
+                    executor.submit(
+                        self._plotter.create_most_expensive_jobs_graph,
+                        jobs=report.top_5_most_expensive_jobs,
+                        file_title="Top 5 Most Expensive Jobs",
+                    ),
+                ),
+                (
+                    "Cost by Machine Type",
+                    executor.submit(
+                        self._plotter.create_pie_chart,
+                        labels=machine_type_labels,
+                        values=machine_type_values,
+                        colors=express.colors.sequential.Rainbow_r,
+                        title="Cost by Machine Type",
+                    ),
+                ),
+                (
+                    "Cost by Job Type",
+                    executor.submit(
+                        self._plotter.create_pie_chart,
+                        labels=job_type_labels,
+                        values=job_type_values,
+                        colors=PIE_CHART_COLORS,
+                        title="Cost by Job Type",
+                    ),
+                ),
+            ]
+            sections.append((self._format_equinix_message, graphs))
+
+        return sections
+
+    def send_report(self, report: Report, trends: Trends) -> None:
+        # Graphs are rendered in the background while the messages are posted.
+        # The plotter's renderer handles one graph at a time, hence a single worker,
+        # and uploads stay sequential so each graph follows its own message
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sections = self._submit_sections(executor=executor, report=report)
+            thread_time_stamp = self._post_message_without_trends(
+                report=report,
+                format_function=self._format_header_message,
+                thread_time_stamp=None,
             )
+            for format_function, graphs in sections:
+                self._post_message_with_trends(
+                    report=report,
+                    trends=trends,
+                    format_function=format_function,
+                    thread_time_stamp=thread_time_stamp,
+                )
+                for file_title, graph in graphs:
+                    filename, file = graph.result()
+                    self._upload_file(
+                        file_title=file_title,
+                        filename=filename,
+                        file=file,
+                        thread_time_stamp=thread_time_stamp,
+                    )
 
     @staticmethod
     def _format_header_message(
         report: Report,
     ) -> list[dict[str, Any]]:
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "CI Report",
-                    "emoji": True,
-                },
-            },
+            _HEADER_BLOCK,
             {
                 "type": "section",
                 "text": {
@@ -242,13 +294,7 @@ class SlackReporter:
             text += f" \t  _{report.success_rate_for_e2e_or_subsystem_periodic_jobs:.2f}%_ *success rate*\n"
 
         return [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Periodic e2e/subsystem jobs*\n",
-                },
-            },
+            _PERIODIC_TITLE_BLOCK,
             {
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": text},
@@ -273,14 +319,8 @@ class SlackReporter:
             text += f" \t  _{report.success_rate_for_postsubmit_jobs:.2f}%_ *success rate*\n"
 
         return [
-            {"type": "divider"},
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Postsubmit jobs*\n",
-                },
-            },
+            _DIVIDER_BLOCK,
+            _POSTSUBMIT_TITLE_BLOCK,
             {
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": text},
@@ -305,14 +345,8 @@ class SlackReporter:
             text += f" \t  _{report.success_rate_for_e2e_or_subsystem_presubmit_jobs:.2f}%_ *success rate*\n"
 
         return [
-            {"type": "divider"},
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Presubmit e2e/subsystem jobs*\n",
-                },
-            },
+            _DIVIDER_BLOCK,
+            _PRESUBMIT_TITLE_BLOCK,
             {
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": text},
@@ -330,14 +364,8 @@ class SlackReporter:
         self, report: Report, trends: Trends
     ) -> list[dict[str, Any]]:
         return [
-            {"type": "divider"},
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Equinix*",
-                },
-            },
+            _DIVIDER_BLOCK,
+            _EQUINIX_TITLE_BLOCK,
             {
                 "type": "section",
                 "text": {
@@ -50,6 +50,10 @@ class EquinixUsage(BaseModel):
     start_date: datetime
     end_date: Optional[datetime]
 
+    # read back by the reports through the same cache as the events
+    class Config:
+        frozen = True
+
     @property
     def job_build_id(self) -> str:
         return self.name.split("-")[-1]
@@ -65,9 +69,15 @@ class EquinixUsageEvent(BaseModel):
     class JobBuildID(BaseModel):
         build_id: str
 
+        class Config:
+            frozen = True
+
     job: JobBuildID
     usage: EquinixUsage
 
+    class Config:
+        frozen = True
+
     @classmethod
     def create_from_equinix_usage(cls, usage: EquinixUsage) -> "EquinixUsageEvent":
         return cls(job=cls.JobBuildID(build_id=usage.job_build_id), usage=usage)
@@ -135,7 +145,7 @@ class EquinixUsagesExtractor:
         usages_should_be_indexed = []
         for usage in usages:
             if usage.is_bandwidth_usage():
-                cls._change_bandwidth_usage_time_interval(
+                usage = cls._change_bandwidth_usage_time_interval(
                     non_bandwidth_usage=cls._find_non_bandwidth_usage(
                         usage_name=usage.name, usages=usages
                     ),
@@ -151,10 +161,13 @@ class EquinixUsagesExtractor:
     def _change_bandwidth_usage_time_interval(
         cls, non_bandwidth_usage: EquinixUsage, bandwidth_usage: EquinixUsage
     ) -> EquinixUsage:
-        """Modifies the time of the bandwidth usage to match that of the non-bandwidth usage."""
-        bandwidth_usage.start_date = non_bandwidth_usage.start_date
-        bandwidth_usage.end_date = non_bandwidth_usage.end_date
-        return bandwidth_usage
+        """Returns a copy of the bandwidth usage with the time of the non-bandwidth usage."""
+        return bandwidth_usage.copy(
+            update={
+                "start_date": non_bandwidth_usage.start_date,
+                "end_date": non_bandwidth_usage.end_date,
+            }
+        )
 
     @staticmethod
     def _find_non_bandwidth_usage(
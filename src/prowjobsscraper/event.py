@@ -15,7 +15,14 @@ from prowjobsscraper.prowjob import ProwJob
 from prowjobsscraper.step import JobStep
 
 
-class JobRefs(BaseModel):
+class _FrozenModel(BaseModel):
+    # events are read back in bulk by the reports and shared between cached results,
+    # so they are immutable once created
+    class Config:
+        frozen = True
+
+
+class JobRefs(_FrozenModel):
     base_ref: Optional[str]
     org: Optional[str]
     pull: Optional[str]
@@ -31,7 +38,7 @@ class JobRefs(BaseModel):
         )
 
 
-class JobEquinixDetails(BaseModel):
+class JobEquinixDetails(_FrozenModel):
     facility: str
     hostname: str
     id: str
@@ -58,7 +65,7 @@ class JobEquinixDetails(BaseModel):
         return None
 
 
-class JobDetails(BaseModel):
+class JobDetails(_FrozenModel):
     build_id: Optional[str]
     cloud_cluster_profile: Optional[str]
     cloud: Optional[str]
@@ -74,7 +81,7 @@ class JobDetails(BaseModel):
     variant: Optional[str]
 
 
-class JobEvent(BaseModel):
+class JobEvent(_FrozenModel):
     job: JobDetails
 
     @classmethod
@@ -104,14 +111,14 @@ class JobEvent(BaseModel):
         )
 
 
-class StepDetails(BaseModel):
+class StepDetails(_FrozenModel):
     details: Optional[str]
     duration: int
     name: str
     state: str
 
 
-class StepEvent(BaseModel):
+class StepEvent(_FrozenModel):
     job: JobDetails
     step: StepDetails
 
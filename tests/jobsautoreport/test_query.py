@@ -0,0 +1,428 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from threading import Event
+from unittest.mock import MagicMock
+
+import pytest
+from diskcache import Cache  # type: ignore
+from freezegun import freeze_time
+from opensearchpy.exceptions import SerializationError, TransportError
+
+from jobsautoreport.query import OrjsonSerializer, Querier
+
+valid_job_hit = {
+    "_id": "1",
+    "sort": [1679918400000, "1640330374884102144"],
+    "_source": {
+        "job": {
+            "build_id": "1640330374884102144",
+            "duration": 2053,
+            "name": "assisted-service-master-edge-e2e-metal-assisted-0",
+            "refs": {
+                "base_ref": "master",
+                "org": "openshift",
+                "repo": "assisted-service",
+            },
+            "start_time": "2023-03-27T12:00:00Z",
+            "state": "success",
+            "type": "periodic",
+            "url": "test",
+            "variant": "edge",
+            "context": "e2e-metal-assisted",
+        }
+    },
+}
+
+
+def search_response(hits: list[dict]) -> dict:
+    return {
+        "pit_id": "test-pit-id",
+        "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+        "hits": {"hits": hits},
+    }
+
+
+@pytest.fixture
+def opensearch_client() -> MagicMock:
+    client = MagicMock()
+    client.create_point_in_time.return_value = {"pit_id": "test-pit-id"}
+    client.search.side_effect = lambda **_: search_response([valid_job_hit])
+    return client
+
+
+@pytest.fixture
+def querier(opensearch_client: MagicMock) -> Querier:
+    return Querier(
+        opensearch_client=opensearch_client,
+        jobs_index="jobs-*",
+        steps_index="steps-*",
+        usages_index="usages-*",
+        scan_slices=1,
+    )
+
+
+def test_query_jobs_should_serve_repeated_queries_from_cache(
+    querier: Querier, opensearch_client: MagicMock
+):
+    now = datetime.now()
+    a_week_ago = now - timedelta(weeks=1)
+
+    first_jobs = querier.query_jobs(from_date=a_week_ago, to_date=now)
+    second_jobs = querier.query_jobs(from_date=a_week_ago, to_date=now)
+
+    assert opensearch_client.search.call_count == 1
+    assert first_jobs == second_jobs
+    assert first_jobs[0].build_id == "1640330374884102144"
+
+    # mutating a returned list should not leak into the cache
+    first_jobs.clear()
+    assert len(querier.query_jobs(from_date=a_week_ago, to_date=now)) == 1
+
+
+def test_query_jobs_should_scan_again_after_cache_is_cleared(
+    querier: Querier, opensearch_client: MagicMock
+):
+    now = datetime.now()
+    a_week_ago = now - timedelta(weeks=1)
+
+    querier.query_jobs(from_date=a_week_ago, to_date=now)
+    querier.clear_cache()
+    querier.query_jobs(from_date=a_week_ago, to_date=now)
+    querier.query_jobs(from_date=a_week_ago - timedelta(weeks=1), to_date=a_week_ago)
+
+    assert opensearch_client.search.call_count == 3
+
+
+def test_queries_on_the_same_index_and_window_should_be_cached_separately(
+    opensearch_client: MagicMock,
+):
+    opensearch_client.search.side_effect = lambda **_: search_response([])
+    querier = Querier(
+        opensearch_client=opensearch_client,
+        jobs_index="events-*",
+        steps_index="events-*",
+        usages_index="events-*",
+        scan_slices=1,
+    )
+    now = datetime.now()
+    a_week_ago = now - timedelta(weeks=1)
+
+    querier.query_jobs(from_date=a_week_ago, to_date=now)
+    querier.query_packet_setup_step_events(from_date=a_week_ago, to_date=now)
+    querier.query_usage_events(from_date=a_week_ago, to_date=now)
+
+    assert opensearch_client.search.call_count == 3
+
+
+def test_query_jobs_should_paginate_with_search_after_and_release_point_in_time(
+    opensearch_client: MagicMock,
+):
+    second_job_hit = {
+        **valid_job_hit,
+        "_id": "2",
+        "sort": [1679918400000, "1640330374884102145"],
+    }
+    opensearch_client.search.side_effect = [
+        search_response([valid_job_hit]),
+        search_response([second_job_hit]),
+        search_response([]),
+    ]
+    querier = Querier(
+        opensearch_client=opensearch_client,
+        jobs_index="jobs-*",
+        steps_index="steps-*",
+        usages_index="usages-*",
+        scan_size=1,
+        scan_slices=1,
+    )
+    now = datetime.now()
+
+    jobs = querier.query_jobs(from_date=now - timedelta(weeks=1), to_date=now)
+
+    assert len(jobs) == 2
+    opensearch_client.create_point_in_time.assert_called_once_with(
+        index="jobs-*", keep_alive="5m", request_timeout=60
+    )
+    search_bodies = [
+        call.kwargs["body"] for call in opensearch_client.search.call_args_list
+    ]
+    assert "search_after" not in search_bodies[0]
+    assert search_bodies[1]["search_after"] == [1679918400000, "1640330374884102144"]
+    assert search_bodies[2]["search_after"] == [1679918400000, "1640330374884102145"]
+    assert all(
+        body["pit"] == {"id": "test-pit-id", "keep_alive": "5m"}
+        and body["sort"] == [{"job.start_time": "asc"}, {"job.build_id": "asc"}]
+        for body in search_bodies
+    )
+    opensearch_client.delete_point_in_time.assert_called_once_with(
+        body={"pit_id": ["test-pit-id"]}
+    )
+
+
+def test_query_jobs_should_scan_a_slice_per_shard_within_one_point_in_time(
+    opensearch_client: MagicMock,
+):
+    opensearch_client.indices.get_settings.return_value = {
+        "jobs-2023.13": {"settings": {"index": {"number_of_shards": "3"}}},
+        "jobs-2023.14": {"settings": {"index": {"number_of_shards": "2"}}},
+    }
+    querier = Querier(
+        opensearch_client=opensearch_client,
+        jobs_index="jobs-*",
+        steps_index="steps-*",
+        usages_index="usages-*",
+    )
+    now = datetime.now()
+    a_week_ago = now - timedelta(weeks=1)
+
+    jobs = querier.query_jobs(from_date=a_week_ago, to_date=now)
+    querier.query_jobs(from_date=a_week_ago - timedelta(weeks=1), to_date=a_week_ago)
+
+    assert len(jobs) == 3
+    opensearch_client.indices.get_settings.assert_called_once_with(
+        index="jobs-*", name="index.number_of_shards"
+    )
+    assert opensearch_client.create_point_in_time.call_count == 2
+    assert opensearch_client.delete_point_in_time.call_count == 2
+    search_bodies = [
+        call.kwargs["body"] for call in opensearch_client.search.call_args_list
+    ]
+    assert sorted(body["slice"]["id"] for body in search_bodies) == [0, 0, 1, 1, 2, 2]
+    assert all(body["slice"]["max"] == 3 for body in search_bodies)
+    assert all(body["pit"]["id"] == "test-pit-id" for body in search_bodies)
+
+
+def test_sliced_scan_should_yield_hits_before_every_slice_is_done(
+    opensearch_client: MagicMock,
+):
+    last_slice_may_finish = Event()
+    finished_slices = []
+
+    def search(body: dict, **_) -> dict:
+        if body["slice"]["id"] == 1:
+            last_slice_may_finish.wait(timeout=5)
+        finished_slices.append(body["slice"]["id"])
+        return search_response([valid_job_hit])
+
+    opensearch_client.search.side_effect = search
+    querier = Querier(
+        opensearch_client=opensearch_client,
+        jobs_index="jobs-*",
+        steps_index="steps-*",
+        usages_index="usages-*",
+        scan_slices=2,
+    )
+
+    hits = querier._scan(
+        query={}, index_name="jobs-*", sort=[], source_includes=["job"]
+    )
+    next(hits)
+    assert finished_slices == [0]
+
+    last_slice_may_finish.set()
+    assert len(list(hits)) == 1
+    opensearch_client.delete_point_in_time.assert_called_once_with(
+        body={"pit_id": ["test-pit-id"]}
+    )
+
+
+def test_sliced_scan_should_raise_the_error_of_a_failed_slice(
+    opensearch_client: MagicMock,
+):
+    def search(body: dict, **_) -> dict:
+        if body["slice"]["id"] == 1:
+            raise TransportError(500, "search_phase_execution_exception")
+        return search_response([valid_job_hit])
+
+    opensearch_client.search.side_effect = search
+    querier = Querier(
+        opensearch_client=opensearch_client,
+        jobs_index="jobs-*",
+        steps_index="steps-*",
+        usages_index="usages-*",
+        scan_slices=2,
+    )
+    now = datetime.now()
+
+    with pytest.raises(TransportError):
+        querier.query_jobs(from_date=now - timedelta(weeks=1), to_date=now)
+
+    opensearch_client.delete_point_in_time.assert_called_once_with(
+        body={"pit_id": ["test-pit-id"]}
+    )
+
+
+def weekly_report_windows(
+    run_time: datetime,
+) -> tuple[tuple[datetime, datetime], tuple[datetime, datetime]]:
+    # the current and last windows jobsautoreport.main queries for a weekly report
+    current_end = (run_time - timedelta(hours=6)).replace(
+        minute=0, second=0, microsecond=0
+    )
+    current_start = current_end - timedelta(weeks=1)
+    return (current_start, current_end), (
+        current_start - timedelta(weeks=1),
+        current_start,
+    )
+
+
+def searched_ranges(opensearch_client: MagicMock) -> list[tuple[datetime, datetime]]:
+    ranges = [
+        call.kwargs["body"]["query"]["bool"]["filter"][0]["range"]["job.start_time"]
+        for call in opensearch_client.search.call_args_list
+    ]
+    return [(r["gte"], r["lte"]) for r in ranges]
+
+
+def job_range_opensearch_client() -> MagicMock:
+    # an index with a job starting every 6 hours in April 2023
+    start_times = [
+        datetime(2023, 4, 1, tzinfo=timezone.utc) + timedelta(hours=6 * i)
+        for i in range(4 * 30)
+    ]
+
+    def search(body: dict, **_) -> dict:
+        searched_range = body["query"]["bool"]["filter"][0]["range"]["job.start_time"]
+        return search_response(
+            [
+                {
+                    **valid_job_hit,
+                    "_source": {
+                        "job": {
+                            **valid_job_hit["_source"]["job"],
+                            "build_id": start_time.isoformat(),
+                            "start_time": start_time.isoformat(),
+                        }
+                    },
+                }
+                for start_time in start_times
+                if searched_range["gte"] <= start_time <= searched_range["lte"]
+            ]
+        )
+
+    client = MagicMock()
+    client.create_point_in_time.return_value = {"pit_id": "test-pit-id"}
+    client.search.side_effect = search
+    return client
+
+
+def test_query_jobs_should_load_the_days_the_previous_scheduled_run_persisted(
+    tmp_path: Path,
+):
+    first_run_time = datetime(2023, 4, 10, 12, tzinfo=timezone.utc)
+    first_run_current_window, _ = weekly_report_windows(first_run_time)
+    with freeze_time(first_run_time, ignore=["pydantic"]), Cache(
+        directory=str(tmp_path)
+    ) as disk_cache:
+        first_run_current_jobs = Querier(
+            opensearch_client=job_range_opensearch_client(),
+            jobs_index="jobs-*",
+            steps_index="steps-*",
+            usages_index="usages-*",
+            scan_slices=1,
+            disk_cache=disk_cache,
+        ).query_jobs(*first_run_current_window)
+
+    second_run_time = first_run_time + timedelta(weeks=1)
+    _, second_run_last_window = weekly_report_windows(second_run_time)
+    second_run_client = job_range_opensearch_client()
+    with freeze_time(second_run_time, ignore=["pydantic"]), Cache(
+        directory=str(tmp_path)
+    ) as disk_cache:
+        second_run_last_jobs = Querier(
+            opensearch_client=second_run_client,
+            jobs_index="jobs-*",
+            steps_index="steps-*",
+            usages_index="usages-*",
+            scan_slices=1,
+            disk_cache=disk_cache,
+        ).query_jobs(*second_run_last_window)
+
+    assert second_run_last_window == first_run_current_window
+    assert second_run_last_jobs == first_run_current_jobs
+    assert len(second_run_last_jobs) == 4 * 7 + 1
+    # 2023-04-04 to 2023-04-08 had settled by the first run and are loaded from disk.
+    # 2023-04-09 settled since, and the partial days around the window are queried
+    assert searched_ranges(second_run_client) == [
+        (
+            datetime(2023, 4, 3, 6, tzinfo=timezone.utc),
+            datetime(2023, 4, 4, tzinfo=timezone.utc),
+        ),
+        (
+            datetime(2023, 4, 9, tzinfo=timezone.utc),
+            datetime(2023, 4, 10, tzinfo=timezone.utc),
+        ),
+        (
+            datetime(2023, 4, 10, tzinfo=timezone.utc),
+            datetime(2023, 4, 10, 6, tzinfo=timezone.utc),
+        ),
+    ]
+
+
+def test_clear_cache_should_keep_the_results_persisted_on_disk(
+    opensearch_client: MagicMock, tmp_path: Path
+):
+    two_days_ago = datetime.now(tz=timezone.utc) - timedelta(days=2)
+    with Cache(directory=str(tmp_path)) as disk_cache:
+        querier = Querier(
+            opensearch_client=opensearch_client,
+            jobs_index="jobs-*",
+            steps_index="steps-*",
+            usages_index="usages-*",
+            scan_slices=1,
+            disk_cache=disk_cache,
+        )
+        querier.query_jobs(
+            from_date=two_days_ago - timedelta(weeks=1), to_date=two_days_ago
+        )
+        persisted_entries = len(disk_cache)
+
+        querier.clear_cache()
+
+        assert persisted_entries > 0
+        assert len(disk_cache) == persisted_entries
+
+
+@freeze_time("2023-04-10 12:00:00", ignore=["pydantic"])
+def test_query_jobs_should_not_persist_days_that_ended_recently(tmp_path: Path):
+    opensearch_client = job_range_opensearch_client()
+    from_date = datetime(2023, 4, 9, 6, tzinfo=timezone.utc)
+    to_date = datetime(2023, 4, 10, 6, tzinfo=timezone.utc)
+    with Cache(directory=str(tmp_path)) as disk_cache:
+        Querier(
+            opensearch_client=opensearch_client,
+            jobs_index="jobs-*",
+            steps_index="steps-*",
+            usages_index="usages-*",
+            scan_slices=1,
+            disk_cache=disk_cache,
+        ).query_jobs(from_date=from_date, to_date=to_date)
+
+        assert len(disk_cache) == 0
+
+    assert searched_ranges(opensearch_client) == [(from_date, to_date)]
+
+
+def test_orjson_serializer_should_pass_strings_through():
+    assert OrjsonSerializer().dumps('{"query": {}}') == '{"query": {}}'
+
+
+def test_orjson_serializer_should_encode_datetimes_and_fall_back_to_default():
+    body = {
+        "gte": datetime(2023, 1, 1, tzinfo=timezone.utc),
+        "size": Decimal("1.5"),
+    }
+
+    assert (
+        OrjsonSerializer().dumps(body)
+        == '{"gte":"2023-01-01T00:00:00+00:00","size":1.5}'
+    )
+
+
+def test_orjson_serializer_should_wrap_errors_in_serialization_error():
+    with pytest.raises(SerializationError):
+        OrjsonSerializer().loads(b"not json")
+
+    with pytest.raises(SerializationError):
+        OrjsonSerializer().dumps({"unsupported": object()})
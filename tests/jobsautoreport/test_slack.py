@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Any, Callable
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -23,7 +23,7 @@ def slack_reporter(test_thread_time_stamp) -> SlackReporter:
     response_mock.validate.return_value = True
     response_mock.__getitem__.side_effect = test_thread_time_stamp.__getitem__
     web_client_mock.chat_postMessage.return_value = response_mock
-    web_client_mock.files_upload.return_value = response_mock
+    web_client_mock.files_upload_v2.return_value = response_mock
 
     return SlackReporter(web_client=web_client_mock, channel_id=test_channel)
 
@@ -388,56 +388,63 @@ def test_send_report_should_successfully_call_slack_api_with_expected_message_fo
         blocks=blocks["expected_blocks_periodic"],
         thread_ts=test_thread_time_stamp["ts"],
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_10_failed_periodic_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_10_failed_periodic_jobs",
         initial_comment="Top 10 Failed Periodic Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
     slack_reporter._client.chat_postMessage.assert_any_call(
         channel=slack_reporter._channel_id,
         blocks=blocks["expected_blocks_presubmit"],
         thread_ts=test_thread_time_stamp["ts"],
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_10_failed_presubmit_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_10_failed_presubmit_jobs",
         initial_comment="Top 10 Failed Presubmit Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_5_triggered_presubmit_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_5_triggered_presubmit_jobs",
         initial_comment="Top 5 Triggered Presubmit Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
     slack_reporter._client.chat_postMessage.assert_any_call(
         channel=slack_reporter._channel_id,
         blocks=blocks["expected_blocks_postsubmit"],
         thread_ts=test_thread_time_stamp["ts"],
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_10_failed_postsubmit_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_10_failed_postsubmit_jobs",
         initial_comment="Top 10 Failed Postsubmit Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
     slack_reporter._client.chat_postMessage.assert_any_call(
         channel=slack_reporter._channel_id,
         blocks=blocks["expected_blocks_equinix"],
         thread_ts=test_thread_time_stamp["ts"],
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_5_most_expensive_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_5_most_expensive_jobs",
         initial_comment="Top 5 Most Expensive Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
+    for call in slack_reporter._client.files_upload_v2.call_args_list:
+        assert call.kwargs["file"].startswith(b"\x89PNG")
 
 
 def test_send_report_should_successfully_call_slack_api_with_filtering_none_success_rates(
@@ -460,45 +467,50 @@ def test_send_report_should_successfully_call_slack_api_with_filtering_none_succ
         blocks=blocks["expected_blocks_presubmit"],
         thread_ts=test_thread_time_stamp["ts"],
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_10_failed_presubmit_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_10_failed_presubmit_jobs",
         initial_comment="Top 10 Failed Presubmit Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_5_triggered_presubmit_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_5_triggered_presubmit_jobs",
         initial_comment="Top 5 Triggered Presubmit Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
     slack_reporter._client.chat_postMessage.assert_any_call(
         channel=slack_reporter._channel_id,
         blocks=blocks["expected_blocks_equinix"],
         thread_ts=test_thread_time_stamp["ts"],
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/top_5_most_expensive_jobs.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="top_5_most_expensive_jobs",
         initial_comment="Top 5 Most Expensive Jobs",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/cost_by_machine_type.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="cost_by_machine_type",
         initial_comment="Cost by Machine Type",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
-    slack_reporter._client.files_upload.assert_any_call(
-        channels=[slack_reporter._channel_id],
-        file="/tmp/cost_by_job_type.png",
+    slack_reporter._client.files_upload_v2.assert_any_call(
+        channel=slack_reporter._channel_id,
+        file=ANY,
         filename="cost_by_job_type",
         initial_comment="Cost by Job Type",
         thread_ts=test_thread_time_stamp["ts"],
+        request_file_info=False,
     )
 
 